@@ -5,7 +5,6 @@
 import serial
 import sys
 import time
-import threading
 
 start_val   = 0x7E
 end_val     = 0xE7
@@ -13,6 +12,7 @@ output1     = 6
 output2     = 202
 api_key     = [0xC9, 0xA4, 0x03, 0xE4]
 port_set	= [1, 1]
+frame_rate  = 40 # Fade updates per second
 
 class DMXConnection:
 	def __init__(self, port, output = 1):
@@ -97,7 +97,7 @@ class DMXConnection:
 		"""
 		if not 1 <= chan <= 512:
 			raise ValueError("Invalid channel specified: %s" % str(chan))
-		val = max(0, min(val, 255)) # Restrict value
+		val = max(0, min(int(val), 255)) # Restrict value
 		self.chan_list[chan] = val
 		if auto_render == True:
 			self.render()
@@ -118,6 +118,20 @@ class DMXConnection:
 					self.dmx_frame[i] = 0
 		for i in self.chan_list.keys():
 			self.dmx_frame[i] = self.chan_list[i]
+		self.render_frame(self.dmx_frame)
+		self.chan_list.clear()
+		if newlist == True:
+			self.chan_list.clear()				
+
+	def render_frame(self, frame):
+		"""Executes a complete DMX frame, bypassing the channel list.
+
+		Parameters
+		----------
+		frame: list
+			513 channel values, where frame[chan] is the value of DMX channel chan.
+		"""
+		self.dmx_frame = list(frame)
 		packet = [
 				start_val,
 				self.label,
@@ -127,11 +141,29 @@ class DMXConnection:
 		packet += self.dmx_frame
 		packet.append(end_val)
 		self.port.write(packet)
-		self.chan_list.clear()
-		if newlist == True:
-			self.chan_list.clear()				
 
-	def fade(self, chan, val, secs = 3):
+	def set_chan16(self, chan, fine_chan, val, auto_render = False):
+		"""Sets a 16-bit value across a coarse and fine channel pair in local channel list.
+
+		Parameters
+		----------
+		chan: int
+			DMX channel holding the coarse (high) byte.
+			Must be between 1 and 512.
+		fine_chan: int
+			DMX channel holding the fine (low) byte.
+			Must be between 1 and 512.
+		val: int
+			Value to be assigned to the channel pair.
+			Must be between 0 and 65535.
+		auto_render: bool, optional(default=False)
+			If set to true, executes the set DMX channels.
+		"""
+		val = max(0, min(int(val), 65535)) # Restrict value
+		self.set_chan(chan, val >> 8)
+		self.set_chan(fine_chan, val & 0xFF, auto_render)
+
+	def fade(self, chan, val, secs = 3, fine_chan = None):
 		"""Fades a single channel to specified value.
 
 		Parameters
@@ -141,37 +173,58 @@ class DMXConnection:
 			Must be between 1 and 512.
 		val: int
 			Value to be assigned to DMX channel.
-			Must be between 0 and 255.
+			Must be between 0 and 255, or 0 and 65535 if fine_chan is specified.
 		secs: int, optional(default=3)
 			Determines how many seconds to fade the channel to specified value.
+		fine_chan: int, optional(default=None)
+			DMX channel holding the fine byte of a 16-bit channel pair.
 		"""
-		val = max(0, min(val, 255))
-		orig_val = self.dmx_frame[chan]
-		if val > orig_val: # Fade in
-			pause = 1 / ((val - orig_val) / secs / 3)
-			while True:
-				value = self.dmx_frame[chan] + 3
-				self.set_chan(chan, value)
-				self.render(clear = False, newlist = False)
-				time.sleep(pause)
-				if self.dmx_frame[chan] >= val - 3:
-					self.set_chan(chan, val)
-					self.render(clear = False, newlist = False)
-					break
-		elif val < orig_val: # Fade out
-			pause = 1 / (abs(val - orig_val) / secs / 3)
-			while True:
-				value = self.dmx_frame[chan] - 3
-				self.set_chan(chan, value)
-				self.render(clear = False, newlist = False)
-				time.sleep(pause)
-				if self.dmx_frame[chan] <= val + 3:
-					self.set_chan(chan, val)
-					self.render(clear = False, newlist = False)
-					break
-		elif val == orig_val:
-			pass
-		
+		if fine_chan is None:
+			self.fade_chans({chan: val}, secs)
+		else:
+			self.fade_chans({(chan, fine_chan): val}, secs)
+
+	def fade_chans(self, targets, secs = 3):
+		"""Fades several channels together, rendering every channel in one frame per tick.
+
+		Values are interpolated from the time elapsed since the fade started,
+		so time spent rendering does not slow the fade down.
+
+		Parameters
+		----------
+		targets: dict
+			Maps a DMX channel to an 8-bit value,
+			or a (coarse, fine) channel pair to a 16-bit value.
+		secs: int, optional(default=3)
+			Determines how many seconds to fade the channels to the specified values.
+
+		Examples
+		--------
+		>>> dmx.fade_chans({1: 255, (2, 3): 32768}, 5)
+		"""
+		fades = []
+		for chan, val in targets.items():
+			if isinstance(chan, tuple):
+				orig_val = (self.dmx_frame[chan[0]] << 8) | self.dmx_frame[chan[1]]
+				fades.append((chan, orig_val, max(0, min(val, 65535))))
+			else:
+				fades.append((chan, self.dmx_frame[chan], max(0, min(val, 255))))
+		start = time.monotonic()
+		tick = 0
+		while True:
+			progress = min((time.monotonic() - start) / secs, 1) if secs > 0 else 1
+			for chan, orig_val, val in fades:
+				value = round(orig_val + (val - orig_val) * progress)
+				if isinstance(chan, tuple):
+					self.set_chan16(chan[0], chan[1], value)
+				else:
+					self.set_chan(chan, value)
+			self.render(clear = False, newlist = False)
+			if progress >= 1:
+				break
+			tick += 1
+			time.sleep(max(0, start + tick / frame_rate - time.monotonic()))
+
 	def generate(self, secs = 3):
 		"""Fades all channels in channel list.
 
@@ -183,13 +236,9 @@ class DMXConnection:
 		for i in range(0, 512):  
 			if i not in self.chan_list.keys():
 				self.dmx_frame[i] = 0
-		for chan in set(self.chan_list.keys()):
-			threading.Thread(target = self.fade, args = [chan, self.chan_list[chan], secs]).start()
-		main_thread = threading.current_thread()
-		for t in threading.enumerate():
-			if t is main_thread:
-				continue
-			t.join()
+		targets = dict(self.chan_list)
+		self.chan_list.clear()
+		self.fade_chans(targets, secs)
 		self.chan_list.clear()
 
 	def DBO(self):
@@ -152,12 +152,16 @@ class Fixture():
 	def pan(self):
 		"""Initialises the ability to use the pan channel of the fixture."""
 		self.pan_offset = self.data["availableChannels"]["pan"]["offset"]
-		self.range = self.data["availableChannels"]["pan"]["range"]
+		self.pan_fine_offset = self._fine_offset("pan")
+		self.pan_range = self.data["availableChannels"]["pan"]["range"]
+		self.range = self.pan_range
 		self.dmx_per_deg = 255/self.range
 
 	def set_pan(self, val):
 		"""Sets the pan of the fixture.
 
+		Angles are set at 16-bit precision if the fixture has a pan fine channel.
+
 		Parameters
 		----------
 		val
@@ -173,32 +177,98 @@ class Fixture():
 		>>> dmx.render()
 		"""
 		if isinstance(val, int):
-			 self.link.set_chan(self.address + self.pan_offset, val)
+			self._set_16bit(self.pan_offset, self.pan_fine_offset, max(0, min(val, 255)) << 8)
 		elif "*" in val:
-			angle = float(val.strip("*"))
-			val = int(angle * self.dmx_per_deg)
-			self.link.set_chan(self.address + self.pan_offset, val) 
+			self._set_16bit(self.pan_offset, self.pan_fine_offset, self._angle_to_16bit(val, self.pan_range))
 
 	def tilt(self):
 		"""Initialises the ability to use the tilt channel of the fixture."""
 		self.tilt_offset = self.data["availableChannels"]["tilt"]["offset"]
-		self.range = self.data["availableChannels"]["tilt"]["range"]
+		self.tilt_fine_offset = self._fine_offset("tilt")
+		self.tilt_range = self.data["availableChannels"]["tilt"]["range"]
+		self.range = self.tilt_range
 		self.dmx_per_deg = 255/self.range
 
 	def set_tilt(self, val):
 		"""Sets the tilt of the fixture.
 
+		Angles are set at 16-bit precision if the fixture has a tilt fine channel.
+
 		Parameters
 		----------
 		val
 			Value(int) or angle(str) to set the tilt of the fixture to.
 		"""
 		if isinstance(val, int):
-			 self.link.set_chan(self.address + self.tilt_offset, val)
+			self._set_16bit(self.tilt_offset, self.tilt_fine_offset, max(0, min(val, 255)) << 8)
 		elif "*" in val:
-			angle = float(val.strip("*"))
-			val = int(angle * self.dmx_per_deg)
-			self.link.set_chan(self.address + self.tilt_offset, val)
+			self._set_16bit(self.tilt_offset, self.tilt_fine_offset, self._angle_to_16bit(val, self.tilt_range))
+
+	def move_targets(self, pan = None, tilt = None):
+		"""Returns the channel targets for moving the fixture, for use with fade_chans.
+
+		Parameters
+		----------
+		pan: optional(default=None)
+			Value(int) or angle(str) to move the pan of the fixture to.
+		tilt: optional(default=None)
+			Value(int) or angle(str) to move the tilt of the fixture to.
+		"""
+		targets = {}
+		if pan is not None:
+			targets.update(self._move_target(pan, self.pan_offset, self.pan_fine_offset, self.pan_range))
+		if tilt is not None:
+			targets.update(self._move_target(tilt, self.tilt_offset, self.tilt_fine_offset, self.tilt_range))
+		return targets
+
+	def move(self, pan = None, tilt = None, secs = 3):
+		"""Moves the fixture smoothly to a pan and tilt position.
+
+		Pan and tilt are faded together at 16-bit precision
+		where the fixture has fine channels.
+
+		Parameters
+		----------
+		pan: optional(default=None)
+			Value(int) or angle(str) to move the pan of the fixture to.
+		tilt: optional(default=None)
+			Value(int) or angle(str) to move the tilt of the fixture to.
+		secs: int, optional(default=3)
+			Determines how many seconds the move takes.
+
+		Examples
+		--------
+		>>> MH = fixtures.Fixture(dmx, "Rave", "Mini_Spot_Moving_Head", 1)
+		>>> MH.config()
+		>>> MH.move("270*", "45*", 10)
+		"""
+		self.link.fade_chans(self.move_targets(pan, tilt), secs)
+
+	def _fine_offset(self, name):
+		"""Returns the offset of the fine channel paired with a channel, or None."""
+		for d in self.data["availableChannels"].values():
+			if d["type"] == name + " fine":
+				return d["offset"]
+		return None
+
+	def _angle_to_16bit(self, val, deg_range):
+		"""Converts an angle(str) to a 16-bit value."""
+		angle = float(val.strip("*"))
+		return max(0, min(int(angle * 65535 / deg_range), 65535))
+
+	def _move_target(self, val, offset, fine_offset, deg_range):
+		"""Returns the channel target for moving a coarse/fine channel pair to a value(int) or angle(str)."""
+		val = max(0, min(val, 255)) << 8 if isinstance(val, int) else self._angle_to_16bit(val, deg_range)
+		if fine_offset is None:
+			return {self.address + offset: val >> 8}
+		return {(self.address + offset, self.address + fine_offset): val}
+
+	def _set_16bit(self, offset, fine_offset, val):
+		"""Sets a 16-bit value, using only the coarse channel if there is no fine channel."""
+		if fine_offset is None:
+			self.link.set_chan(self.address + offset, val >> 8)
+		else:
+			self.link.set_chan16(self.address + offset, self.address + fine_offset, val)
 
 	def speed(self, name):
 		"""Initialises the ability to use a speed function of the fixture.
@@ -1,10 +1,11 @@
+import copy
 import json
 import os
 import pylightdmx
 from pylightdmx import fixtures
 
 class FixtureGroup:
-	def __init__(self, connection, rig, name):
+	def __init__(self, connection, rig, name, members = None):
 		"""Inititialises fixture group from rig definition.
 		
 		Parameters
@@ -17,6 +18,9 @@ class FixtureGroup:
 		name: str
 			The name of the fixture group.
 			Must correspond to the fixture group name in the rig defintion.
+		members: dict, optional(default=None)
+			Already loaded fixtures to make up the group, by fixture name.
+			If not specified, the fixtures are loaded from the rig definition.
 		
         Examples
         --------
@@ -24,6 +28,9 @@ class FixtureGroup:
         """
 		self.link = connection
 		self.g = {}
+		if members is not None:
+			self.g.update(members)
+			return
 		for fixture in rig.rig_data["groups"][name]:
 			self.g[fixture] = fixtures.Fixture(connection, rig.rig_data["fixtures"][fixture]["brand"], rig.rig_data["fixtures"][fixture]["model"], rig.rig_data["fixtures"][fixture]["address"])
 			self.g[fixture].config()
@@ -146,6 +153,25 @@ class FixtureGroup:
 		for fixture in self.g.keys():
 			self.g[fixture].set_tilt(val)
 
+	def move(self, pan = None, tilt = None, secs = 3):
+		"""Moves the fixture group smoothly to a pan and tilt position.
+
+		All fixtures in the group are faded together in the same frames.
+
+		Parameters
+		----------
+		pan: optional(default=None)
+			Value(int) or angle(str) to move the pan of the fixture group to.
+		tilt: optional(default=None)
+			Value(int) or angle(str) to move the tilt of the fixture group to.
+		secs: int, optional(default=3)
+			Determines how many seconds the move takes.
+		"""
+		targets = {}
+		for fixture in self.g.keys():
+			targets.update(self.g[fixture].move_targets(pan, tilt))
+		self.link.fade_chans(targets, secs)
+
 	def speed(self, name):
 		"""Initialises the ability to use a speed function of the fixture group.
 
@@ -218,14 +244,134 @@ class Rig:
         >>> r.f["LED1"].set_rgb(255, 0, 0) # Use of a fixture in rig
         >>> r.g["Dimmers"].set_intensity(255) # Use of a group in the rig
         """
+		self.link = connection
+		self.name = name
 		path = os.path.join(os.path.dirname(__file__), "rigs", name + ".json")
 		with open(path, 'r') as f:
 			self.rig_data = json.load(f)
 		self.f = {}
 		self.g = {}
-		for name, d in self.rig_data["fixtures"].items():
-			self.f[name] = fixtures.Fixture(connection, d["brand"], d["model"], d["address"])
-			self.f[name].config()
-		for name in self.rig_data["groups"]:
-			self.g[name] = FixtureGroup(connection, self, name)
-			self.g[name].config()
\ No newline at end of file
+		for fixture, d in self.rig_data["fixtures"].items():
+			self.f[fixture] = fixtures.Fixture(connection, d["brand"], d["model"], d["address"])
+			self.f[fixture].config()
+		for group, members in self.rig_data["groups"].items():
+			self.g[group] = FixtureGroup(connection, self, group, {fixture: _repatch(self.f[fixture], self.f[fixture].address) for fixture in members})
+
+	def reload(self):
+		"""Reloads the rig definition, rebuilding only what has changed.
+
+		Fixtures whose patch is unchanged are kept as they are.
+		Fixtures that have only been readdressed reuse their loaded profile,
+		and their current levels are moved to the new address.
+		Groups are rebuilt only if their members have changed.
+		The new fixtures, groups and DMX frame are swapped in once fully built
+		and the frame is rendered, so output is not blacked out while reloading.
+		Changes waiting in the channel list move with their fixtures.
+
+		Returns
+		-------
+		dict
+			Names of the fixtures and groups that were "added", "changed" and "removed".
+
+		Raises
+		------
+		ValueError
+			If a group contains a fixture that is not in the rig definition.
+			The loaded rig is left unchanged.
+
+		Examples
+		--------
+		>>> r = rigs.Rig(dmx, "example_rig")
+		>>> # Edit example_rig.json
+		>>> r.reload()
+		{'added': [], 'changed': ['Dimmer6'], 'removed': []}
+		"""
+		path = os.path.join(os.path.dirname(__file__), "rigs", self.name + ".json")
+		with open(path, 'r') as f:
+			rig_data = json.load(f)
+		for group, members in rig_data["groups"].items():
+			for fixture in members:
+				if fixture not in rig_data["fixtures"]:
+					raise ValueError("Invalid fixture specified in group %s: %s" % (group, fixture))
+		old_fixtures = self.rig_data["fixtures"]
+		old_groups = self.rig_data["groups"]
+		frame = list(self.link.dmx_frame)
+		moved = {}
+		released = set()
+		rebuilt = set()
+		changes = {"added": [], "changed": [], "removed": []}
+		new_f = {}
+		for fixture, d in rig_data["fixtures"].items():
+			old = old_fixtures.get(fixture)
+			if old == d:
+				new_f[fixture] = self.f[fixture]
+				continue
+			if old is None:
+				changes["added"].append(fixture)
+			else:
+				changes["changed"].append(fixture)
+				released.update(_fixture_chans(self.f[fixture]))
+			if old is not None and (old["brand"], old["model"]) == (d["brand"], d["model"]):
+				new_f[fixture] = _repatch(self.f[fixture], d["address"])
+				for old_chan, new_chan in zip(_fixture_chans(self.f[fixture]), _fixture_chans(new_f[fixture])):
+					if 1 <= new_chan <= 512:
+						moved[old_chan] = new_chan
+			else:
+				new_f[fixture] = fixtures.Fixture(self.link, d["brand"], d["model"], d["address"])
+				new_f[fixture].config()
+				rebuilt.update(_fixture_chans(new_f[fixture]))
+		for fixture in old_fixtures:
+			if fixture not in rig_data["fixtures"]:
+				changes["removed"].append(fixture)
+				released.update(_fixture_chans(self.f[fixture]))
+		changed = set(changes["added"]) | set(changes["changed"]) | set(changes["removed"])
+		new_g = {}
+		for group, members in rig_data["groups"].items():
+			if old_groups.get(group) == members and not changed.intersection(members):
+				new_g[group] = self.g[group]
+				continue
+			changes["changed" if group in old_groups else "added"].append(group)
+			group_fixtures = {}
+			for fixture in members:
+				if fixture not in changed and group in self.g and fixture in self.g[group].g:
+					group_fixtures[fixture] = self.g[group].g[fixture]
+				else:
+					group_fixtures[fixture] = _repatch(new_f[fixture], new_f[fixture].address)
+			new_g[group] = FixtureGroup(self.link, self, group, group_fixtures)
+		for group in old_groups:
+			if group not in rig_data["groups"]:
+				changes["removed"].append(group)
+		# Carry levels of readdressed fixtures, and clear channels no longer in use
+		# or now used by a fixture with a different profile
+		in_use = set()
+		for fixture in new_f.values():
+			in_use.update(_fixture_chans(fixture))
+		cleared = ((released - in_use) | rebuilt) - set(moved.values())
+		for old_chan, new_chan in moved.items():
+			frame[new_chan] = self.link.dmx_frame[old_chan]
+		for chan in cleared:
+			if 1 <= chan <= 512:
+				frame[chan] = 0
+		pending = {}
+		for chan, val in self.link.chan_list.items():
+			if chan in moved:
+				pending[moved[chan]] = val
+			elif chan not in cleared:
+				pending.setdefault(chan, val)
+		self.f, self.g, self.rig_data = new_f, new_g, rig_data
+		self.link.chan_list.clear()
+		self.link.chan_list.update(pending)
+		self.link.render_frame(frame)
+		return changes
+
+def _fixture_chans(fixture):
+	"""Returns the DMX channels occupied by a fixture."""
+	return [fixture.address + d["offset"] for d in fixture.data["availableChannels"].values()]
+
+def _repatch(fixture, address):
+	"""Returns a copy of a configured fixture at a new address without reloading its profile."""
+	new = copy.copy(fixture)
+	new.address = address
+	new.speed_offset = dict(fixture.speed_offset)
+	new.macro_offset = dict(fixture.macro_offset)
+	return new
@@ -0,0 +1,237 @@
+# scheduler.py
+
+"""Runs cues, fades and events against a show clock for use with pylightdmx"""
+
+import bisect
+import threading
+import time
+import pylightdmx
+
+class Scheduler:
+	def __init__(self, connection, look_ahead = 4, rate = pylightdmx.frame_rate, fps = 25, rewind = 0.5):
+		"""Creates a show scheduler driving a DMX connection.
+
+		Frames are worked out from the show time alone. A producer thread
+		pre-renders upcoming frames into a ring buffer and calls events, while
+		the output thread only writes finished frames. Output therefore carries
+		on for up to look_ahead ticks while frames or events are slow. After a
+		stall of the output itself, output resumes at the current show time
+		rather than replaying the ticks that were missed.
+
+		Parameters
+		----------
+		connection: obj
+			The DMX connection opened by pylightdmx for the DMX device in use.
+		look_ahead: int, optional(default=4)
+			Number of ticks to pre-render ahead of the show time.
+		rate: int, optional(default=pylightdmx.frame_rate)
+			Frames output per second.
+		fps: int, optional(default=25)
+			Frames per second of timecode(str) passed to set_time.
+		rewind: float, optional(default=0.5)
+			Seconds the show time must jump back by to be treated as a rewind.
+			Smaller steps back, such as timecode resyncs, hold output instead
+			of repeating frames and events.
+
+		Examples
+		--------
+		>>> show = scheduler.Scheduler(dmx)
+		>>> show.cue(0, {1: 255})
+		>>> show.fade(2, {1: 0}, 5)
+		>>> show.start()
+		"""
+		self.link = connection
+		self.look_ahead = look_ahead
+		self.rate = rate
+		self.fps = fps
+		self.rewind = rewind
+		self.items = []
+		self.events = []
+		self.base_frame = list(connection.dmx_frame)
+		self.buffer = [None] * (look_ahead + 1)
+		self.lock = threading.Lock()
+		self.threads = []
+		self.running = False
+		self.timecode = None
+		self.last_time = None
+
+	def set_time(self, val):
+		"""Sets the show time from an external timecode source.
+
+		Between updates the show time runs on from the last timecode received.
+
+		Parameters
+		----------
+		val
+			Time in seconds(float) or timecode(str) in the form "HH:MM:SS:FF".
+		"""
+		if isinstance(val, str):
+			h, m, s, f = [int(x) for x in val.split(":")]
+			val = h * 3600 + m * 60 + s + f / self.fps
+		self.timecode = (val, time.monotonic())
+
+	def now(self):
+		"""Returns the current show time in seconds."""
+		secs, received = self.timecode
+		return secs + time.monotonic() - received
+
+	def at(self, secs, func, *args):
+		"""Calls a function when the show reaches a time.
+
+		Parameters
+		----------
+		secs: float
+			Show time in seconds to call the function at.
+		func: callable
+			Function to call from the producer thread.
+			Exceptions raised by the function are printed and do not stop the show.
+		"""
+		with self.lock:
+			bisect.insort(self.events, (secs, len(self.events), func, args))
+
+	def cue(self, secs, levels):
+		"""Snaps channels to levels when the show reaches a time.
+
+		Parameters
+		----------
+		secs: float
+			Show time in seconds to execute the cue at.
+		levels: dict
+			Maps a DMX channel to an 8-bit value,
+			or a (coarse, fine) channel pair to a 16-bit value.
+		"""
+		self._add(secs, levels, 0)
+
+	def fade(self, secs, targets, duration = 3):
+		"""Fades channels when the show reaches a time.
+
+		Parameters
+		----------
+		secs: float
+			Show time in seconds to start the fade at.
+		targets: dict
+			Maps a DMX channel to an 8-bit value,
+			or a (coarse, fine) channel pair to a 16-bit value.
+		duration: int, optional(default=3)
+			Determines how many seconds to fade the channels to the specified values.
+
+		Examples
+		--------
+		>>> MH = fixtures.Fixture(dmx, "Rave", "Mini_Spot_Moving_Head", 1)
+		>>> MH.config()
+		>>> show.fade(10, MH.move_targets("270*", "45*"), 4)
+		"""
+		self._add(secs, targets, duration)
+
+	def frame_at(self, secs):
+		"""Returns the DMX frame for a show time.
+
+		Parameters
+		----------
+		secs: float
+			Show time in seconds.
+		"""
+		with self.lock:
+			items = list(self.items)
+		frame = list(self.base_frame)
+		for start, _, targets, duration in items:
+			if start > secs:
+				break
+			progress = min((secs - start) / duration, 1) if duration > 0 else 1
+			for chan, val in targets.items():
+				orig_val = _get(frame, chan)
+				_put(frame, chan, round(orig_val + (val - orig_val) * progress))
+		return frame
+
+	def start(self):
+		"""Starts pre-rendering and outputting frames from separate threads.
+
+		Unless set_time has been called, the show time starts from 0.
+		"""
+		if self.timecode is None:
+			self.set_time(0)
+		self.running = True
+		self.threads = [
+			threading.Thread(target = self._produce, daemon = True),
+			threading.Thread(target = self._run, daemon = True)
+			]
+		for thread in self.threads:
+			thread.start()
+
+	def stop(self):
+		"""Stops outputting frames."""
+		self.running = False
+		for thread in self.threads:
+			thread.join()
+		self.threads = []
+
+	def _add(self, secs, targets, duration):
+		"""Adds a cue or fade and discards pre-rendered frames."""
+		targets = {chan: max(0, min(val, 65535 if isinstance(chan, tuple) else 255)) for chan, val in targets.items()}
+		with self.lock:
+			bisect.insort(self.items, (secs, len(self.items), targets, duration))
+			self.buffer = [None] * (self.look_ahead + 1)
+
+	def _frame(self, tick):
+		"""Returns the frame for a tick, from the ring buffer if it has been pre-rendered."""
+		buffer = self.buffer # Frames rendered before a change are stored in the discarded buffer
+		slot = buffer[tick % len(buffer)]
+		if slot is not None and slot[0] == tick:
+			return slot[1]
+		frame = self.frame_at(tick / self.rate)
+		buffer[tick % len(buffer)] = (tick, frame)
+		return frame
+
+	def _fire(self, secs):
+		"""Calls events due since the previous tick."""
+		if self.last_time is None or secs < self.last_time - self.rewind: # Started or rewound
+			self.last_time = secs - 1 / self.rate
+		elif secs <= self.last_time: # Jitter, events up to last_time have already fired
+			return
+		with self.lock:
+			due = [e for e in self.events if self.last_time < e[0] <= secs]
+		self.last_time = secs
+		for _, _, func, args in due:
+			try:
+				func(*args)
+			except Exception as e:
+				print("Event at %ss failed: %r" % (secs, e))
+
+	def _wait(self, tick):
+		"""Sleeps until the show time reaches the tick after tick."""
+		time.sleep(max(0, (tick + 1) / self.rate - self.now()))
+
+	def _produce(self):
+		"""Calls events and pre-renders upcoming frames into the ring buffer every tick."""
+		while self.running:
+			tick = round(self.now() * self.rate)
+			self._fire(tick / self.rate)
+			for ahead in range(tick, tick + self.look_ahead + 1):
+				self._frame(ahead)
+			self._wait(tick)
+
+	def _run(self):
+		"""Outputs the frame for each tick, using the pre-rendered frame if it is ready."""
+		last_tick = None
+		while self.running:
+			tick = round(self.now() * self.rate)
+			if last_tick is None or tick > last_tick or tick < last_tick - self.rewind * self.rate:
+				self.link.render_frame(self._frame(tick))
+				last_tick = tick
+			# Wake when the show time reaches the next tick, so a stall never leaves a backlog
+			self._wait(last_tick)
+
+
+def _get(frame, chan):
+	"""Returns the value of a channel or (coarse, fine) channel pair in a frame."""
+	if isinstance(chan, tuple):
+		return (frame[chan[0]] << 8) | frame[chan[1]]
+	return frame[chan]
+
+def _put(frame, chan, val):
+	"""Sets the value of a channel or (coarse, fine) channel pair in a frame."""
+	if isinstance(chan, tuple):
+		frame[chan[0]] = val >> 8
+		frame[chan[1]] = val & 0xFF
+	else:
+		frame[chan] = val
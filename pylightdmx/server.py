@@ -0,0 +1,220 @@
+# server.py
+
+"""Network control server for use with pylightdmx"""
+
+import asyncio
+import json
+import struct
+import time
+import pylightdmx
+
+channels_msg   = 1 # Payload: (uint16 channel, uint8 value) repeated
+channels16_msg = 2 # Payload: (uint16 coarse, uint16 fine, uint16 value) repeated
+command_msg    = 3 # Payload: UTF-8 JSON object
+header         = struct.Struct(">BH") # Message type, payload length
+max_error      = 200 # Characters of an error message to reply with
+
+class ControlServer:
+	def __init__(self, connection, rig = None, host = "127.0.0.1", port = 7770, rate = pylightdmx.frame_rate):
+		"""Creates a TCP server for controlling a DMX connection and rig over the network.
+
+		Every message is a header of a message type byte and a big-endian
+		uint16 payload length, followed by the payload. Every message is answered,
+		in order, by one command_msg reply holding a JSON object with "ok" set to
+		true or false. Changes from all clients are collected and executed
+		together, with at most one render per tick.
+
+		Parameters
+		----------
+		connection: obj
+			The DMX connection opened by pylightdmx for the DMX device in use.
+		rig: obj, optional(default=None)
+			The rig opened by pylightdmx.rigs to expose fixtures and groups from.
+		host: str, optional(default="127.0.0.1")
+			Address to listen on.
+		port: int, optional(default=7770)
+			Port to listen on.
+		rate: int, optional(default=pylightdmx.frame_rate)
+			Ticks per second.
+
+		Examples
+		--------
+		>>> srv = server.ControlServer(dmx, rigs.Rig(dmx, "example_rig"))
+		>>> srv.run()
+		"""
+		self.link = connection
+		self.rig = rig
+		self.host = host
+		self.port = port
+		self.rate = rate
+		self.presets = {}
+		self.fades = []
+		self.clients = {} # Client handler task: stream writer
+		self.server = None
+		self.ticker = None
+
+	async def start(self):
+		"""Starts listening and rendering from the running event loop."""
+		self.server = await asyncio.start_server(self._client, self.host, self.port)
+		self.port = self.server.sockets[0].getsockname()[1]
+		self.ticker = asyncio.ensure_future(self._tick())
+
+	async def stop(self):
+		"""Stops listening and rendering."""
+		self.ticker.cancel()
+		self.server.close()
+		for writer in self.clients.values():
+			writer.close() # Clients see end of stream and finish
+		await asyncio.gather(self.ticker, *self.clients, return_exceptions = True)
+		await self.server.wait_closed()
+
+	def run(self):
+		"""Runs the server until interrupted."""
+		async def main():
+			await self.start()
+			await self.server.serve_forever()
+		asyncio.run(main())
+
+	def command(self, cmd):
+		"""Executes a command and returns its result.
+
+		Parameters
+		----------
+		cmd: dict
+			Command, where cmd["op"] is one of:
+			"fixture" or "group", calling the setter cmd["method"] with cmd["args"]
+			on the fixture or fixture group cmd["name"];
+			"reload", reloading the rig;
+			"save" or "recall", saving or recalling the levels of preset cmd["name"];
+			"cue", fading to preset cmd["name"] over cmd["secs"] seconds.
+
+		Raises
+		------
+		ValueError
+			If the command is not valid.
+
+		Examples
+		--------
+		>>> srv.command({"op": "group", "name": "LEDs", "method": "set_rgb", "args": [255, 0, 0]})
+		>>> srv.command({"op": "save", "name": "red"})
+		"""
+		if not isinstance(cmd, dict):
+			raise ValueError("Invalid command specified: %s" % cmd)
+		op = cmd.get("op")
+		if op in ("fixture", "group"):
+			if self.rig is None:
+				raise ValueError("No rig loaded")
+			items = self.rig.f if op == "fixture" else self.rig.g
+			if cmd.get("name") not in items:
+				raise ValueError("Invalid %s specified: %s" % (op, cmd.get("name")))
+			method = cmd.get("method", "")
+			if not isinstance(method, str) or not method.startswith("set_") or not hasattr(items[cmd["name"]], method):
+				raise ValueError("Invalid method specified: %s" % method)
+			args = cmd.get("args", [])
+			if not isinstance(args, list) or not all(isinstance(arg, (int, str)) and not isinstance(arg, bool) for arg in args):
+				raise ValueError("Invalid arguments specified, must be a list of ints and strings")
+			try:
+				getattr(items[cmd["name"]], method)(*args)
+			except (AttributeError, KeyError, TypeError, ValueError) as e: # E.g. channel not initialised
+				raise ValueError("Could not call %s: %s" % (method, e))
+		elif op == "reload":
+			if self.rig is None:
+				raise ValueError("No rig loaded")
+			try:
+				return self.rig.reload()
+			except OSError as e:
+				raise ValueError("Could not reload rig: %s" % e)
+		elif op == "save":
+			self.presets[cmd["name"]] = self._levels()
+		elif op in ("recall", "cue"):
+			if cmd.get("name") not in self.presets:
+				raise ValueError("Invalid preset specified: %s" % cmd.get("name"))
+			secs = cmd.get("secs", 0) if op == "cue" else 0
+			if isinstance(secs, bool) or not isinstance(secs, (int, float)):
+				raise ValueError("Invalid fade time specified: %s" % secs)
+			orig = self._levels()
+			target = self.presets[cmd["name"]]
+			chans = {chan for chan in range(1, 513) if orig[chan] != target[chan]}
+			self.fades = [(time.monotonic(), secs, orig, target, chans)] # Replaces fades in progress
+		else:
+			raise ValueError("Invalid command specified: %s" % op)
+
+	def _levels(self):
+		"""Returns the current levels, including changes not yet rendered."""
+		levels = list(self.link.dmx_frame)
+		for chan, val in self.link.chan_list.items():
+			levels[chan] = val
+		return levels
+
+	def _handle(self, kind, payload):
+		"""Executes a message and returns the result to reply with."""
+		if kind == channels_msg:
+			for chan, val in struct.iter_unpack(">HB", payload):
+				self.link.set_chan(chan, val)
+			return {"ok": True, "result": None}
+		elif kind == channels16_msg:
+			for chan, fine_chan, val in struct.iter_unpack(">HHH", payload):
+				self.link.set_chan16(chan, fine_chan, val)
+			return {"ok": True, "result": None}
+		elif kind == command_msg:
+			return {"ok": True, "result": self.command(json.loads(payload.decode("utf-8")))}
+		else:
+			raise ValueError("Invalid message type: %s" % kind)
+
+	async def _client(self, reader, writer):
+		"""Reads and executes messages from a client until it disconnects."""
+		task = asyncio.current_task()
+		self.clients[task] = writer
+		try:
+			while True:
+				kind, length = header.unpack(await reader.readexactly(header.size))
+				payload = await reader.readexactly(length)
+				try:
+					reply = self._handle(kind, payload)
+				except (ValueError, KeyError, TypeError, struct.error) as e:
+					reply = {"ok": False, "error": str(e)[:max_error]}
+				data = json.dumps(reply).encode("utf-8")
+				if len(data) > 0xFFFF:
+					data = json.dumps({"ok": False, "error": "Reply too long"}).encode("utf-8")
+				writer.write(header.pack(command_msg, len(data)) + data)
+				await writer.drain()
+		except (asyncio.IncompleteReadError, ConnectionError):
+			pass
+		finally:
+			del self.clients[task]
+			writer.close()
+
+	def _fade(self):
+		"""Sets the levels of fades in progress for this tick.
+
+		Channels set by clients since the last tick are dropped from the fade,
+		so the newest change wins.
+		"""
+		now = time.monotonic()
+		fades = []
+		for start, secs, orig, target, chans in self.fades:
+			progress = min((now - start) / secs, 1) if secs > 0 else 1
+			chans.difference_update(self.link.chan_list)
+			for chan in chans:
+				self.link.set_chan(chan, round(orig[chan] + (target[chan] - orig[chan]) * progress))
+			if progress < 1:
+				fades.append((start, secs, orig, target, chans))
+		self.fades = fades
+
+	def _update(self):
+		"""Renders changes from all clients and fades in progress for this tick."""
+		self._fade()
+		if self.link.chan_list:
+			self.link.render(clear = False)
+
+	async def _tick(self):
+		"""Calls _update once per tick."""
+		loop = asyncio.get_running_loop()
+		next_tick = loop.time()
+		while True:
+			try:
+				self._update()
+			except Exception as e: # Keep rendering, e.g. after a serial write error
+				print("Could not render tick: %r" % e)
+			next_tick += 1 / self.rate
+			await asyncio.sleep(max(0, next_tick - loop.time()))
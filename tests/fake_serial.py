@@ -0,0 +1,21 @@
+from unittest import mock
+import serial
+import pylightdmx
+
+class FakeSerial:
+	"""Records packets written instead of opening a serial device."""
+	def __init__(self, port, baudrate, timeout = None):
+		self.portstr = port
+		self.packets = []
+
+	def write(self, packet):
+		self.packets.append(list(serial.to_bytes(packet))) # Raises like pyserial for bad values
+
+	def close(self):
+		pass
+
+
+def connection():
+	"""Returns a DMX connection writing to a FakeSerial."""
+	with mock.patch("serial.Serial", FakeSerial), mock.patch("builtins.print"):
+		return pylightdmx.DMXConnection("/dev/null")
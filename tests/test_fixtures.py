@@ -0,0 +1,53 @@
+import time
+import unittest
+import pylightdmx
+from pylightdmx import fixtures
+import fake_serial
+
+class MovingHeadTest(unittest.TestCase):
+	def setUp(self):
+		self.dmx = fake_serial.connection()
+		self.mh = fixtures.Fixture(self.dmx, "Rave", "Mini_Spot_Moving_Head", 1)
+		self.mh.config()
+
+	def pan(self, packet):
+		"""Returns the 16-bit pan value in a packet."""
+		frame = packet[4:-1]
+		return (frame[1] << 8) | frame[2]
+
+	def test_set_pan_angle_writes_coarse_and_fine(self):
+		self.mh.set_pan("270*") # Half of the 540 degree range
+		self.assertEqual(self.dmx.chan_list, {1: 0x7F, 2: 0xFF})
+
+	def test_set_pan_value_resets_fine(self):
+		self.mh.set_pan("270*")
+		self.dmx.render(clear = False)
+		self.mh.set_pan(128)
+		self.dmx.render(clear = False)
+		self.assertEqual(self.dmx.dmx_frame[1:3], [128, 0])
+
+	def test_set_tilt_angle_writes_coarse_and_fine(self):
+		self.mh.set_tilt("135*") # Half of the 270 degree range
+		self.assertEqual(self.dmx.chan_list, {3: 0x7F, 4: 0xFF})
+
+	def test_move_ramps_at_16_bit(self):
+		self.mh.move("540*", None, 0.2)
+		pans = [self.pan(packet) for packet in self.dmx.port.packets]
+		self.assertEqual(pans, sorted(pans))
+		self.assertEqual(pans[-1], 65535)
+		self.assertTrue(any(pan & 0xFF not in (0, 0xFF) for pan in pans)) # Fine byte used mid-move
+
+	def test_fade_chans_frame_count(self):
+		secs = 0.25
+		start = time.monotonic()
+		self.dmx.fade_chans({10: 255}, secs)
+		elapsed = time.monotonic() - start
+		frames = len(self.dmx.port.packets)
+		self.assertLessEqual(frames, secs * pylightdmx.frame_rate + 2)
+		self.assertGreaterEqual(frames, secs * pylightdmx.frame_rate / 2)
+		self.assertLess(elapsed, secs + 2 / pylightdmx.frame_rate)
+		self.assertEqual(self.dmx.dmx_frame[10], 255)
+
+
+if __name__ == "__main__":
+	unittest.main()
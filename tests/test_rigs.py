@@ -0,0 +1,110 @@
+import json
+import os
+import tempfile
+import unittest
+from pylightdmx import rigs
+import fake_serial
+
+def dimmer(address):
+	return {"address": address, "brand": "Generic", "model": "Dimmer"}
+
+def rgb(address):
+	return {"address": address, "brand": "Generic", "model": "RGB"}
+
+
+class RigReloadTest(unittest.TestCase):
+	def setUp(self):
+		self.dir = tempfile.TemporaryDirectory()
+		self.name = os.path.join(self.dir.name, "test_rig") # Rig appends ".json"
+		self.dmx = fake_serial.connection()
+		self.write({
+			"D1": dimmer(1),
+			"D2": dimmer(2),
+			"D3": dimmer(3),
+			"C1": rgb(10)
+			}, {
+			"Dimmers": ["D1", "D2", "D3"],
+			"Colours": ["C1"]
+			})
+		self.rig = rigs.Rig(self.dmx, self.name)
+
+	def tearDown(self):
+		self.dir.cleanup()
+
+	def write(self, fixtures, groups):
+		with open(self.name + ".json", "w") as f:
+			json.dump({"name": "TestRig", "fixtures": fixtures, "groups": groups}, f)
+
+	def test_unchanged_rig_keeps_everything(self):
+		f, g = dict(self.rig.f), dict(self.rig.g)
+		self.assertEqual(self.rig.reload(), {"added": [], "changed": [], "removed": []})
+		for name in f:
+			self.assertIs(self.rig.f[name], f[name])
+		for name in g:
+			self.assertIs(self.rig.g[name], g[name])
+
+	def test_readdress_moves_levels_and_renders(self):
+		self.rig.f["D1"].set_intensity(200)
+		self.dmx.render()
+		self.rig.f["D2"].set_intensity(90) # Pending at the old address
+		colours = self.rig.g["Colours"]
+		renders = len(self.dmx.port.packets)
+		self.write({"D1": dimmer(1), "D2": dimmer(20), "D3": dimmer(3), "C1": rgb(10)},
+			{"Dimmers": ["D1", "D2", "D3"], "Colours": ["C1"]})
+		changes = self.rig.reload()
+		self.assertEqual(changes["changed"], ["D2", "Dimmers"])
+		self.assertEqual(len(self.dmx.port.packets), renders + 1)
+		self.assertEqual(self.dmx.dmx_frame[1], 200)
+		self.assertEqual(self.dmx.chan_list, {20: 90})
+		self.assertEqual(self.rig.g["Dimmers"].g["D2"].address, 20)
+		self.assertIs(self.rig.g["Colours"], colours)
+		self.rig.g["Dimmers"].set_intensity(10)
+		self.assertEqual(sorted(self.dmx.chan_list), [1, 3, 20])
+
+	def test_swap_addresses(self):
+		self.rig.f["D1"].set_intensity(100)
+		self.rig.f["D2"].set_intensity(200)
+		self.dmx.render()
+		self.write({"D1": dimmer(2), "D2": dimmer(1), "D3": dimmer(3), "C1": rgb(10)},
+			{"Dimmers": ["D1", "D2", "D3"], "Colours": ["C1"]})
+		self.rig.reload()
+		self.assertEqual(self.dmx.dmx_frame[1:3], [200, 100])
+		self.assertEqual(self.rig.f["D1"].address, 2)
+		self.assertEqual(self.rig.f["D2"].address, 1)
+
+	def test_profile_change_clears_channels(self):
+		self.rig.f["D3"].set_intensity(255)
+		self.rig.f["C1"].set_rgb(10, 20, 30)
+		self.dmx.render()
+		self.write({"D1": dimmer(1), "D2": dimmer(2), "D3": rgb(3), "C1": dimmer(10)},
+			{"Dimmers": ["D1", "D2", "D3"], "Colours": ["C1"]})
+		self.rig.reload()
+		self.assertEqual(self.dmx.dmx_frame[3:6], [0, 0, 0])
+		self.assertEqual(self.dmx.dmx_frame[10:13], [0, 0, 0])
+		self.assertEqual(self.rig.f["D3"].name, "RGB")
+
+	def test_membership_changes(self):
+		colours = self.rig.g["Colours"]
+		self.write({"D1": dimmer(1), "D2": dimmer(2), "D4": dimmer(4), "C1": rgb(10)},
+			{"Dimmers": ["D1", "D2", "D4"], "Colours": ["C1"], "All": ["D1", "C1"]})
+		changes = self.rig.reload()
+		self.assertEqual(changes, {"added": ["D4", "All"], "changed": ["Dimmers"], "removed": ["D3"]})
+		self.assertEqual(list(self.rig.g["Dimmers"].g), ["D1", "D2", "D4"])
+		self.assertEqual(list(self.rig.g["All"].g), ["D1", "C1"])
+		self.assertIs(self.rig.g["Colours"], colours)
+
+	def test_removed_fixture_still_in_group(self):
+		self.rig.f["D3"].set_intensity(255)
+		self.dmx.render()
+		f, g = self.rig.f, self.rig.g
+		self.write({"D1": dimmer(1), "D2": dimmer(2), "C1": rgb(10)},
+			{"Dimmers": ["D1", "D2", "D3"], "Colours": ["C1"]})
+		with self.assertRaises(ValueError):
+			self.rig.reload()
+		self.assertIs(self.rig.f, f)
+		self.assertIs(self.rig.g, g)
+		self.assertEqual(self.dmx.dmx_frame[3], 255)
+
+
+if __name__ == "__main__":
+	unittest.main()
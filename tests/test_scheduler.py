@@ -0,0 +1,100 @@
+import time
+import unittest
+from unittest import mock
+from pylightdmx import scheduler
+import fake_serial
+
+class FrameTest(unittest.TestCase):
+	def setUp(self):
+		self.dmx = fake_serial.connection()
+		self.show = scheduler.Scheduler(self.dmx)
+
+	def test_cues_and_fades(self):
+		self.show.cue(0, {1: 255, 5: 300})
+		self.show.fade(1, {1: 0}, 2)
+		self.assertEqual(self.show.frame_at(-1)[1], 0)
+		self.assertEqual(self.show.frame_at(0.5)[1], 255)
+		self.assertEqual(self.show.frame_at(0.5)[5], 255) # Clamped
+		self.assertEqual(self.show.frame_at(2)[1], 128)
+		self.assertEqual(self.show.frame_at(10)[1], 0)
+
+	def test_overlapping_fades(self):
+		self.show.fade(0, {2: 200}, 2)
+		self.show.fade(1, {2: 0}, 2)
+		self.assertEqual(self.show.frame_at(1)[2], 100)
+		self.assertEqual(self.show.frame_at(2)[2], 100)
+		self.assertEqual(self.show.frame_at(3)[2], 0)
+		levels = [self.show.frame_at(t / 10)[2] for t in range(31)]
+		for a, b in zip(levels, levels[1:]):
+			self.assertLessEqual(abs(a - b), 20) # No jumps where the fades overlap
+
+	def test_16_bit_pairs(self):
+		self.show.fade(0, {(3, 4): 65535}, 1)
+		self.assertEqual(self.show.frame_at(0.5)[3:5], [128, 0])
+		self.assertEqual(self.show.frame_at(1)[3:5], [255, 255])
+		self.show.cue(2, {(3, 4): 0x1234})
+		self.assertEqual(self.show.frame_at(2)[3:5], [0x12, 0x34])
+
+
+class ClockTest(unittest.TestCase):
+	def setUp(self):
+		self.dmx = fake_serial.connection()
+
+	def test_set_time_parses_timecode(self):
+		show = scheduler.Scheduler(self.dmx)
+		show.set_time("01:02:03:12")
+		self.assertAlmostEqual(show.now(), 3723.48, places = 2)
+		show = scheduler.Scheduler(self.dmx, fps = 30)
+		show.set_time("00:00:10:15")
+		self.assertAlmostEqual(show.now(), 10.5, places = 2)
+		show.set_time(42.0)
+		self.assertAlmostEqual(show.now(), 42.0, places = 2)
+
+	def test_fire_ignores_jitter(self):
+		show = scheduler.Scheduler(self.dmx)
+		calls = []
+		show.at(1.0, calls.append, "go")
+		show._fire(1.0)
+		show._fire(0.975)
+		show._fire(1.0)
+		self.assertEqual(calls, ["go"])
+
+	def test_fire_repeats_after_rewind(self):
+		show = scheduler.Scheduler(self.dmx)
+		calls = []
+		show.at(1.0, calls.append, "go")
+		show._fire(1.0)
+		show._fire(0.2)
+		show._fire(1.0)
+		self.assertEqual(calls, ["go", "go"])
+
+	def test_failing_event_does_not_stop_others(self):
+		show = scheduler.Scheduler(self.dmx)
+		calls = []
+		show.at(0.5, lambda: 1 / 0)
+		show.at(0.5, calls.append, "next")
+		with mock.patch("builtins.print") as printed:
+			show._fire(0.5)
+		self.assertEqual(calls, ["next"])
+		self.assertIn("ZeroDivisionError", printed.call_args[0][0])
+
+
+class OutputTest(unittest.TestCase):
+	def test_slow_event_does_not_hold_up_output(self):
+		dmx = fake_serial.connection()
+		show = scheduler.Scheduler(dmx, look_ahead = 8)
+		show.fade(0, {1: 255}, 0.5)
+		show.at(0.1, time.sleep, 0.15)
+		writes = []
+		render_frame = dmx.render_frame
+		dmx.render_frame = lambda frame: (writes.append(time.monotonic()), render_frame(frame))
+		show.start()
+		time.sleep(0.6)
+		show.stop()
+		gaps = [b - a for a, b in zip(writes, writes[1:])]
+		self.assertLess(max(gaps), 0.1)
+		self.assertEqual(dmx.dmx_frame[1], 255)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,142 @@
+import asyncio
+import json
+import struct
+import unittest
+from unittest import mock
+from pylightdmx import rigs, server
+import fake_serial
+
+class ControlServerTest(unittest.IsolatedAsyncioTestCase):
+	async def asyncSetUp(self):
+		self.dmx = fake_serial.connection()
+		self.rig = rigs.Rig(self.dmx, "example_rig")
+		# One tick runs on start, later ticks are run by the tests with _update
+		self.srv = server.ControlServer(self.dmx, self.rig, port = 0, rate = 0.001)
+		await self.srv.start()
+		self.clients = []
+
+	async def asyncTearDown(self):
+		for reader, writer in self.clients:
+			writer.close()
+		await self.srv.stop()
+
+	async def connect(self):
+		client = await asyncio.open_connection("127.0.0.1", self.srv.port)
+		self.clients.append(client)
+		return client
+
+	async def send(self, client, kind, payload):
+		reader, writer = client
+		writer.write(server.header.pack(kind, len(payload)) + payload)
+		await writer.drain()
+		kind, length = server.header.unpack(await reader.readexactly(server.header.size))
+		self.assertEqual(kind, server.command_msg)
+		return json.loads(await reader.readexactly(length))
+
+	async def command(self, client, cmd):
+		return await self.send(client, server.command_msg, json.dumps(cmd).encode("utf-8"))
+
+	async def test_batches_clients_into_one_render(self):
+		a = await self.connect()
+		b = await self.connect()
+		payload = b"".join(struct.pack(">HB", chan, 100) for chan in range(100, 200))
+		self.assertTrue((await self.send(a, server.channels_msg, payload))["ok"])
+		self.assertTrue((await self.send(b, server.channels16_msg, struct.pack(">HHH", 300, 301, 0x1234)))["ok"])
+		reply = await self.command(a, {"op": "group", "name": "Dimmers", "method": "set_intensity", "args": [50]})
+		self.assertTrue(reply["ok"])
+		renders = len(self.dmx.port.packets)
+		self.srv._update()
+		self.srv._update()
+		self.assertEqual(len(self.dmx.port.packets), renders + 1)
+		frame = self.dmx.port.packets[-1][4:-1]
+		self.assertEqual(frame[100:200], [100] * 100)
+		self.assertEqual(frame[300:302], [0x12, 0x34])
+		self.assertEqual(frame[61], 50)
+
+	async def test_every_message_is_acknowledged_in_order(self):
+		a = await self.connect()
+		reply = await self.send(a, server.channels_msg, struct.pack(">HB", 0, 255))
+		self.assertFalse(reply["ok"])
+		self.assertIn("Invalid channel", reply["error"])
+		self.assertEqual(await self.command(a, {"op": "save", "name": "a"}), {"ok": True, "result": None})
+		self.assertTrue((await self.send(a, server.channels_msg, struct.pack(">HB", 1, 255)))["ok"])
+
+	async def test_bad_commands_reply_with_error(self):
+		a = await self.connect()
+		await self.command(a, {"op": "save", "name": "a"})
+		bad = [
+			{"op": "fixture", "name": "Dimmer1", "method": "set_pan", "args": [1]},
+			{"op": "fixture", "name": "LED1", "method": "__init__"},
+			{"op": "fixture", "name": "LED1", "method": ["set_rgb"]},
+			{"op": "fixture", "name": "Missing", "method": "set_intensity", "args": [1]},
+			{"op": "recall", "name": "missing"},
+			{"op": "cue", "name": "a", "secs": "slow"},
+			{"op": "bogus"},
+			["op", "save"],
+		]
+		for cmd in bad:
+			self.assertFalse((await self.command(a, cmd))["ok"], cmd)
+		reply = await self.send(a, server.command_msg, b"{not json")
+		self.assertFalse(reply["ok"])
+		reply = await self.send(a, 99, b"")
+		self.assertFalse(reply["ok"])
+		reply = await self.command(a, {"op": "fixture", "name": "Dimmer1", "method": "set_intensity", "args": [10]})
+		self.assertTrue(reply["ok"])
+
+	async def test_non_int_args_are_rejected(self):
+		a = await self.connect()
+		reply = await self.command(a, {"op": "fixture", "name": "LED1", "method": "set_rgb", "args": [0.5, 0, 0]})
+		self.assertFalse(reply["ok"])
+		reply = await self.command(a, {"op": "fixture", "name": "LED1", "method": "set_rgb", "args": "abc"})
+		self.assertFalse(reply["ok"])
+		await self.command(a, {"op": "fixture", "name": "LED1", "method": "set_rgb", "args": [1, 2, 3]})
+		self.srv._update()
+		self.assertEqual(self.dmx.dmx_frame[1:4], [1, 2, 3])
+
+	async def test_tick_survives_render_failure(self):
+		await self.srv.stop()
+		self.srv = server.ControlServer(self.dmx, self.rig, port = 0, rate = 100)
+		write = self.dmx.port.write
+		failures = [OSError("unplugged")]
+		def flaky_write(packet):
+			if failures:
+				raise failures.pop()
+			write(packet)
+		self.dmx.port.write = flaky_write
+		self.dmx.set_chan(1, 255)
+		with mock.patch("builtins.print") as printed:
+			await self.srv.start()
+			await asyncio.sleep(0.1)
+		self.assertIn("unplugged", printed.call_args[0][0])
+		self.assertEqual(self.dmx.port.packets[-1][5], 255)
+		a = await self.connect()
+		await self.send(a, server.channels_msg, struct.pack(">HB", 2, 7))
+		await asyncio.sleep(0.05)
+		self.assertEqual(self.dmx.port.packets[-1][6], 7)
+
+	async def test_long_error_reply_is_capped(self):
+		a = await self.connect()
+		reply = await self.command(a, {"op": "x" * 65500})
+		self.assertFalse(reply["ok"])
+		self.assertLessEqual(len(reply["error"]), server.max_error)
+		self.assertTrue((await self.command(a, {"op": "save", "name": "a"}))["ok"])
+
+	async def test_client_change_wins_over_cue(self):
+		a = await self.connect()
+		payload = struct.pack(">HBHB", 1, 255, 2, 255)
+		await self.send(a, server.channels_msg, payload)
+		self.srv._update()
+		await self.command(a, {"op": "save", "name": "full"})
+		await self.send(a, server.channels_msg, struct.pack(">HBHB", 1, 0, 2, 0))
+		self.srv._update()
+		await self.command(a, {"op": "cue", "name": "full", "secs": 60})
+		await self.send(a, server.channels_msg, struct.pack(">HB", 1, 10))
+		self.srv._update()
+		self.assertEqual(self.dmx.dmx_frame[1], 10)
+		await self.command(a, {"op": "recall", "name": "full"})
+		self.srv._update()
+		self.assertEqual(self.dmx.dmx_frame[1:3], [255, 255])
+
+
+if __name__ == "__main__":
+	unittest.main()